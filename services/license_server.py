@@ -1,13 +1,28 @@
 from datetime import datetime, timezone
 from pathlib import Path
+import base64
+import hashlib
 import json
 import os
 
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
 LICENSES_PATH = Path("legal/licenses/licenses.json")
 
+# Ed25519 private key (base64, raw 32 bytes) used to sign verification tokens
+# that clients may cache; generate with tools/generate_signing_key.py.
+# Without it /verify still works but clients cannot skip it on warm starts.
+SIGNING_KEY = os.getenv("LICENSE_SIGNING_KEY")
+TOKEN_TTL = int(os.getenv("LICENSE_TOKEN_TTL", str(24 * 60 * 60)))
+
+_signer = (
+    Ed25519PrivateKey.from_private_bytes(base64.b64decode(SIGNING_KEY))
+    if SIGNING_KEY
+    else None
+)
+
 app = FastAPI(title="License Verification API")
 
 
@@ -25,6 +40,25 @@ class LicenseRecord(BaseModel):
     notes: str | None = ""
 
 
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def issue_token(
+    signer: Ed25519PrivateKey, key: str, status: dict, now: datetime, expires: datetime
+) -> str:
+    """Sign `status` for `key`; valid until the license or TOKEN_TTL expires."""
+    iat = now.timestamp()
+    payload = {
+        "key_sha256": hashlib.sha256(key.encode()).hexdigest(),
+        "status": status,
+        "iat": iat,
+        "exp": min(iat + TOKEN_TTL, expires.timestamp()),
+    }
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return _b64url(body) + "." + _b64url(signer.sign(body))
+
+
 def load_licenses():
     if LICENSES_PATH.exists():
         with LICENSES_PATH.open("r", encoding="utf-8") as f:
@@ -72,7 +106,7 @@ def verify_license(key: str):
             "plan": rec["plan"],
         }
 
-    return {
+    result = {
         "valid": True,
         "reason": "OK",
         "license_id": rec["id"],
@@ -80,6 +114,9 @@ def verify_license(key: str):
         "seats": rec["seats"],
         "customer_name": rec["customer_name"],
     }
+    if _signer is not None:
+        result["token"] = issue_token(_signer, key, dict(result), now, expires)
+    return result
 
 
 if __name__ == "__main__":
@@ -6,14 +6,37 @@ This is where we enforce the license once at startup.
 
 from __future__ import annotations
 
-from your_project.license_check import enforce_license, LicenseValidationError
-from your_project import core
+import argparse
+from importlib.metadata import PackageNotFoundError, version
 
 
-def main() -> None:
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    try:
+        pkg_version = version("your-project")
+    except PackageNotFoundError:
+        pkg_version = "unknown"
+
+    parser = argparse.ArgumentParser(prog="your_project")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {pkg_version}")
+    parser.add_argument(
+        "--force-recheck",
+        action="store_true",
+        help="ignore cached license results and verify with the license server",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    # 0. Handle --help/--version before importing the license machinery
+    #    (and its HTTP stack), which these don't need
+    args = _parse_args(argv)
+
+    from your_project.license_check import enforce_license, LicenseValidationError
+    from your_project import core
+
     # 1. Enforce license
     try:
-        status = enforce_license()
+        status = enforce_license(force_recheck=args.force_recheck)
     except LicenseValidationError as exc:
         print(f"[LICENSE ERROR] {exc}")
         raise SystemExit(1)
@@ -10,33 +10,221 @@ This module is responsible for:
 
 from __future__ import annotations
 
+import base64
+import binascii
+import functools
+import hashlib
+import hmac
+import json
 import os
+import random
+import threading
+import time
+import warnings
 from dataclasses import dataclass
-from typing import Callable, TypeVar, Any, ParamSpec, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, TypeVar, Any, Mapping, ParamSpec, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# ---- Configuration ---------------------------------------------------------
+if TYPE_CHECKING:
+    # Only the async API and the on-disk cache need these; they import them
+    # on first use so the rest of the package doesn't pay for them at
+    # import time
+    import asyncio
+
+    import httpx
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
-# Where your license server lives (can be overridden via env var)
-LICENSE_SERVER_URL = os.getenv(
+__all__ = [
+    "DISABLE_LICENSE_CHECK",
+    "ENV_LICENSE_KEY",
     "LICENSE_SERVER_URL",
-    "https://your-license-server.example.com",  # TODO: change this
+    "LicenseStatus",
+    "LicenseValidationError",
+    "aclose_license_client",
+    "close_license_session",
+    "enforce_license",
+    "enforce_license_async",
+    "get_cached_status",
+    "get_license_status",
+    "require_license",
+    "require_license_any",
+]
+
+# ---- Configuration ---------------------------------------------------------
+
+_TRUTHY = frozenset({"1", "true", "yes"})
+
+
+@dataclass(slots=True, frozen=True)
+class _Config:
+    server: str  # license server base URL, without trailing slash
+    verify_url: str
+    env_var: str  # name of the env var holding the license key
+    disabled: bool
+    cache_path: Path
+    cache_ttl: int  # seconds
+    negative_cache_path: Path
+    negative_cache_ttl: int  # seconds
+
+
+def _env_int(env: Mapping[str, str], name: str, default: int) -> int:
+    """Read an integer setting, falling back to `default` if it is malformed."""
+    raw = env.get(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        # Don't break importing the package (and its free features) over this
+        warnings.warn(
+            f"Ignoring invalid {name}={raw!r}; using {default}.", stacklevel=2
+        )
+        return default
+
+
+def _load_config() -> _Config:
+    """Read all license settings from the environment in one pass."""
+    env = os.environ
+    # Where your license server lives
+    server = env.get(
+        "LICENSE_SERVER_URL",
+        "https://your-license-server.example.com",  # TODO: change this
+    ).rstrip("/")
+    return _Config(
+        server=server,
+        verify_url=server + "/verify",
+        # Environment variable that users must set with their license key
+        env_var=env.get("LICENSE_ENV_VAR_NAME", "MYAPP_LICENSE_KEY"),
+        # Allow disabling license checks in development (NEVER in production)
+        disabled=env.get("DISABLE_LICENSE_CHECK", "").lower() in _TRUTHY,
+        # Where a verified license is cached between runs, and for how long
+        cache_path=Path(
+            env.get("LICENSE_CACHE_PATH", "~/.cache/myapp/license.json")
+        ).expanduser(),
+        cache_ttl=_env_int(env, "LICENSE_CACHE_TTL", 24 * 60 * 60),
+        # Where a rejected key is remembered so retries don't hit the server
+        negative_cache_path=Path(
+            env.get("LICENSE_NEGATIVE_CACHE_PATH", "~/.cache/myapp/negative.json")
+        ).expanduser(),
+        negative_cache_ttl=_env_int(env, "LICENSE_NEGATIVE_CACHE_TTL", 60),
+    )
+
+
+_CONFIG = _load_config()
+
+# Public half of the license server's token signing key (base64, raw 32
+# bytes; see tools/generate_signing_key.py). Deliberately not configurable
+# from the environment. While empty, nothing is cached on disk.
+_LICENSE_PUBLIC_KEY = ""  # TODO: set this
+
+# Read-only views of the configuration, kept for existing importers
+LICENSE_SERVER_URL = _CONFIG.server
+ENV_LICENSE_KEY = _CONFIG.env_var
+DISABLE_LICENSE_CHECK = _CONFIG.disabled
+
+# ---- HTTP session ----------------------------------------------------------
+
+_RETRY_JITTER = 0.5  # seconds
+_RETRY_BACKOFF_MAX = 60  # seconds
+
+
+class _JitteredRetry(Retry):
+    """
+    urllib3 retries the first failure immediately and only adds its own
+    jitter to non-zero backoffs, so clients that fail together would retry
+    together. Add jitter to every backoff instead.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time() + random.uniform(0, _RETRY_JITTER)
+        return min(backoff, _RETRY_BACKOFF_MAX)
+
+
+def _make_retry() -> Retry:
+    """
+    Retry connection errors and 502/503/504 responses up to 3 times, sleeping
+    0s, 2s and 4s (capped at 60s) plus up to 0.5s of jitter before each retry.
+
+    Each of the 4 attempts may wait out the 5s request timeout, so an
+    unreachable server now blocks startup for roughly 4 x 5s + ~7s of
+    backoff (about 27s) before failing, instead of 5s.
+    """
+    return _JitteredRetry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+
+
+# Reuse one pooled session per process so repeated verifications skip the
+# TCP/TLS handshake.
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=_make_retry(),
 )
+_session = requests.Session()
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
+def close_license_session() -> None:
+    """Close pooled connections to the license server (e.g. on shutdown)."""
+    _session.close()
+
 
-# Environment variable that users must set with their license key
-ENV_LICENSE_KEY = os.getenv("LICENSE_ENV_VAR_NAME", "MYAPP_LICENSE_KEY")
+# Created on first use by the async API. An httpx client can only be used on
+# the event loop it was created on, so remember that loop and start a new
+# client when called from a different one (e.g. a later asyncio.run()).
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    global _async_client, _async_client_loop
+
+    import asyncio
+
+    try:
+        import httpx
+    except ImportError:
+        raise RuntimeError(
+            "Async license verification requires httpx (pip install 'your-project[async]')."
+        ) from None
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        # A client left over from a finished loop can't be closed from here;
+        # dropping it releases its connections with the old loop.
+        _async_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=5.0,
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+async def aclose_license_client() -> None:
+    """Close the async license server client (e.g. on event loop shutdown)."""
+    global _async_client, _async_client_loop
+
+    import asyncio
+
+    if _async_client is not None and _async_client_loop is asyncio.get_running_loop():
+        await _async_client.aclose()
+    _async_client = None
+    _async_client_loop = None
 
-# Allow disabling license checks in development (NEVER in production)
-DISABLE_LICENSE_CHECK = os.getenv("DISABLE_LICENSE_CHECK", "").lower() in {
-    "1",
-    "true",
-    "yes",
-}
 
 # ---- Data models -----------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LicenseStatus:
     valid: bool
     reason: str
@@ -50,52 +238,106 @@ class LicenseValidationError(Exception):
     """Raised when license validation fails or a license is invalid."""
 
 
-# cache so we only hit the server once per process
-_cached_license: Optional[LicenseStatus] = None
+# Stand-in license used when DISABLE_LICENSE_CHECK is set. Plan gates let
+# it through so every feature can be exercised during development.
+_DEV_LICENSE = LicenseStatus(
+    valid=True,
+    reason="License check disabled via DISABLE_LICENSE_CHECK",
+    license_id="DEV-MODE",
+    plan="dev",
+    seats=1,
+    customer_name="Development Mode",
+)
+
+# cache so we only hit the server once per process; pre-populated in dev
+# mode so no license key or server is needed
+_cached_license: Optional[LicenseStatus] = (
+    _DEV_LICENSE if _CONFIG.disabled else None
+)
+
+# bumped whenever _cached_license is (re)published; decorated functions
+# remember the token they last passed their gate with and only re-check
+# the license when it changes
+_license_token = 0
+
+# serializes the first verification so concurrent callers share one request
+_cache_lock = threading.Lock()
 
 
 # ---- Core validation functions --------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def _get_license_key_from_env() -> str:
-    key = os.getenv(ENV_LICENSE_KEY, "").strip()
+    key = os.environ.get(_CONFIG.env_var, "").strip()
     if not key:
         raise LicenseValidationError(
-            f"No license key found. Set environment variable {ENV_LICENSE_KEY}."
+            f"No license key found. Set environment variable {_CONFIG.env_var}."
         )
     return key
 
 
-def _verify_license_online(key: str) -> LicenseStatus:
-    if DISABLE_LICENSE_CHECK:
+def _verify_license_online(key: str) -> tuple[LicenseStatus, Optional[str]]:
+    """Return the server's verdict for `key` and its signed token, if any."""
+    if _CONFIG.disabled:
         # Extremely useful during development, but DANGEROUS in prod.
-        return LicenseStatus(
-            valid=True,
-            reason="License check disabled via DISABLE_LICENSE_CHECK",
-            license_id="DEV-MODE",
-            plan="dev",
-            seats=1,
-            customer_name="Development Mode",
-        )
+        return _DEV_LICENSE, None
 
-    if not LICENSE_SERVER_URL:
+    if not _CONFIG.server:
         raise LicenseValidationError("LICENSE_SERVER_URL is not configured.")
 
-    url = LICENSE_SERVER_URL.rstrip("/") + "/verify"
-
     try:
-        resp = requests.get(url, params={"key": key}, timeout=5)
+        resp = _session.get(_CONFIG.verify_url, params={"key": key}, timeout=5)
     except requests.RequestException as exc:
         raise LicenseValidationError(f"Could not contact license server: {exc}") from exc
 
+    return _status_from_response(resp)
+
+
+async def _verify_license_online_async(
+    key: str,
+) -> tuple[LicenseStatus, Optional[str]]:
+    if _CONFIG.disabled:
+        return _DEV_LICENSE, None
+
+    if not _CONFIG.server:
+        raise LicenseValidationError("LICENSE_SERVER_URL is not configured.")
+
+    client = _get_async_client()
+    import httpx  # already loaded by _get_async_client()
+
+    try:
+        resp = await client.get(_CONFIG.verify_url, params={"key": key})
+    except httpx.HTTPError as exc:
+        raise LicenseValidationError(f"Could not contact license server: {exc}") from exc
+
+    return _status_from_response(resp)
+
+
+def _status_from_response(resp: Any) -> tuple[LicenseStatus, Optional[str]]:
+    """Interpret a /verify response from either requests or httpx."""
     if resp.status_code == 404:
-        return LicenseStatus(valid=False, reason="License not found")
+        return LicenseStatus(valid=False, reason="License not found"), None
 
-    if not resp.ok:
+    if resp.status_code >= 400:
         raise LicenseValidationError(
             f"License server error ({resp.status_code}): {resp.text}"
         )
 
-    data = resp.json()
+    data = _json_body(resp)
+    return _status_from_payload(data), data.get("token")
+
+
+def _json_body(resp: Any) -> Any:
+    # Imported here so processes that never parse a response (warm starts,
+    # dev mode, free features only) don't pay for importing orjson
+    try:
+        import orjson
+    except ImportError:  # optional speedup
+        return resp.json()
+    return orjson.loads(resp.content)
+
+
+def _status_from_payload(data: dict[str, Any]) -> LicenseStatus:
     return LicenseStatus(
         valid=bool(data.get("valid", False)),
         reason=str(data.get("reason", "Unknown")),
@@ -106,24 +348,226 @@ def _verify_license_online(key: str) -> LicenseStatus:
     )
 
 
-def enforce_license() -> LicenseStatus:
+# ---- On-disk cache ---------------------------------------------------------
+#
+# For a valid license the server returns a token signed with its Ed25519 key:
+# the license status, a digest of the key it belongs to, and issue/expiry
+# times. The token is written to LICENSE_CACHE_PATH so warm starts can skip
+# the network round trip. It is trusted only if its signature checks out
+# against _LICENSE_PUBLIC_KEY and it belongs to the current key; its lifetime
+# is capped at LICENSE_CACHE_TTL from issue. Anything else is ignored and the
+# license is verified online.
+#
+# A rejected key is remembered (as a SHA-256 digest, never in plaintext) for
+# a short time so a misconfigured loop can't flood the license server.
+
+
+@functools.lru_cache(maxsize=1)
+def _load_public_key() -> Optional[Ed25519PublicKey]:
+    if not _LICENSE_PUBLIC_KEY:
+        return None
+    try:
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+            Ed25519PublicKey,
+        )
+    except ImportError:  # only needed for the on-disk license cache
+        return None
+    return Ed25519PublicKey.from_public_bytes(base64.b64decode(_LICENSE_PUBLIC_KEY))
+
+
+def _b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _read_license_cache(key: str) -> Optional[tuple[LicenseStatus, float]]:
+    """Return the cached (status, expiry) for `key`, or None if unusable."""
+    public_key = _load_public_key()
+    if public_key is None:
+        return None
+    from cryptography.exceptions import InvalidSignature  # loaded with the key
+
+    try:
+        with _CONFIG.cache_path.open("r", encoding="utf-8") as f:
+            token = json.load(f)["token"]
+        body, sig = (_b64url_decode(part) for part in token.split("."))
+        public_key.verify(sig, body)
+        payload = json.loads(body)
+        if not hmac.compare_digest(payload["key_sha256"], _key_digest(key)):
+            return None
+        exp = min(float(payload["exp"]), float(payload["iat"]) + _CONFIG.cache_ttl)
+        status = _status_from_payload(payload["status"])
+    except (
+        OSError,
+        ValueError,
+        KeyError,
+        TypeError,
+        AttributeError,
+        binascii.Error,
+        InvalidSignature,
+    ):
+        return None
+
+    if exp <= time.time() or not status.valid:
+        return None
+    return status, exp
+
+
+def _write_license_cache(token: str) -> None:
+    _write_cache_file(_CONFIG.cache_path, {"token": token})
+
+
+def _key_digest(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _read_negative_cache(key: str) -> Optional[LicenseStatus]:
+    """Return the recent rejection recorded for `key`, if any."""
+    try:
+        with _CONFIG.negative_cache_path.open("r", encoding="utf-8") as f:
+            blob = json.load(f)
+        if not hmac.compare_digest(blob["key_sha256"], _key_digest(key)):
+            return None
+        if time.time() - float(blob["ts"]) > _CONFIG.negative_cache_ttl:
+            return None
+        return LicenseStatus(valid=False, reason=str(blob["reason"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_negative_cache(key: str, status: LicenseStatus) -> None:
+    blob = {"key_sha256": _key_digest(key), "ts": time.time(), "reason": status.reason}
+    _write_cache_file(_CONFIG.negative_cache_path, blob)
+
+
+def _write_cache_file(path: Path, blob: dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(blob, f)
+        os.replace(tmp, path)
+    except OSError:
+        # The cache is only an optimization; never fail startup over it
+        pass
+
+
+def _store_result(key: str, status: LicenseStatus, token: Optional[str]) -> None:
+    """Record a fresh server verdict for `key` in the matching disk cache."""
+    if _CONFIG.disabled:
+        return
+    if status.valid:
+        if token is not None and _load_public_key() is not None:
+            _write_license_cache(token)
+    else:
+        # A revoked license must not keep starting from the positive cache,
+        # but a rejected (e.g. mistyped) other key mustn't discard it
+        if _read_license_cache(key) is not None:
+            try:
+                _CONFIG.cache_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+        _write_negative_cache(key, status)
+
+
+def _verify_and_cache(key: str) -> LicenseStatus:
+    status, token = _verify_license_online(key)
+    _store_result(key, status, token)
+    return status
+
+
+def _refresh_license_cache(key: str) -> None:
+    """Re-verify in the background and publish the fresh result."""
+    try:
+        status = _verify_and_cache(key)
+    except LicenseValidationError:
+        # Server unreachable: keep running on the cached license
+        return
+    # enforce_license() holds the lock until it has published the cached
+    # status, so taking it here guarantees the fresh result lands last
+    with _cache_lock:
+        _publish_license(status)
+
+
+def _load_cached_license(key: str) -> Optional[LicenseStatus]:
+    """
+    Return the license from the disk caches (a recent rejection counts),
+    refreshing a valid one in the background if it is near expiry.
+    """
+    if _CONFIG.disabled:
+        return None
+
+    cached = _read_license_cache(key)
+    if cached is None:
+        return _read_negative_cache(key)
+
+    status, exp = cached
+    if exp - time.time() < _CONFIG.cache_ttl * 0.1:
+        threading.Thread(
+            target=_refresh_license_cache, args=(key,), daemon=True
+        ).start()
+    return status
+
+
+def _load_license(key: str, force_recheck: bool = False) -> LicenseStatus:
+    """Resolve the license from the disk cache, falling back to the server."""
+    status = None if force_recheck else _load_cached_license(key)
+    if status is None:
+        status = _verify_and_cache(key)
+    return status
+
+
+def _publish_license(status: LicenseStatus) -> None:
+    """Cache `status` and invalidate every armed gating decorator."""
+    global _cached_license, _license_token
+
+    _cached_license = status
+    _license_token += 1
+
+
+def enforce_license(force_recheck: bool = False) -> LicenseStatus:
     """
     Perform license validation and cache the result.
     Call this early in application startup (e.g. __main__.py).
+    `force_recheck` ignores the on-disk caches and asks the server.
     Raises LicenseValidationError on failure.
     """
-    global _cached_license
+    status = _cached_license
+    if status is None:
+        with _cache_lock:
+            # Re-check: another thread may have verified while we waited
+            status = _cached_license
+            if status is None:
+                key = _get_license_key_from_env()
+                status = _load_license(key, force_recheck)
+                _publish_license(status)
+
+    if not status.valid:
+        raise LicenseValidationError(f"Invalid license: {status.reason}")
 
-    if _cached_license is not None:
-        # Already validated this process
-        if not _cached_license.valid:
-            raise LicenseValidationError(f"Invalid license: {_cached_license.reason}")
-        return _cached_license
+    return status
 
-    key = _get_license_key_from_env()
-    status = _verify_license_online(key)
 
-    _cached_license = status
+async def enforce_license_async(force_recheck: bool = False) -> LicenseStatus:
+    """
+    Async variant of enforce_license() for use inside an event loop.
+    Verifies over httpx without blocking the loop; shares the same cache.
+    Raises LicenseValidationError on failure.
+    """
+    status = _cached_license
+    if status is None:
+        key = _get_license_key_from_env()
+        status = None if force_recheck else _load_cached_license(key)
+        if status is None:
+            status, token = await _verify_license_online_async(key)
+            _store_result(key, status, token)
+
+        with _cache_lock:
+            # Keep whichever result was published first
+            current = _cached_license
+            if current is None:
+                _publish_license(status)
+            else:
+                status = current
 
     if not status.valid:
         raise LicenseValidationError(f"Invalid license: {status.reason}")
@@ -136,15 +580,19 @@ def get_license_status() -> LicenseStatus:
     Get (and lazily validate) the current license status.
     Useful inside feature gating decorators or specific functions.
     """
-    global _cached_license
+    status = _cached_license
+    if status is not None and status.valid:
+        return status
 
-    if _cached_license is None:
-        # This will raise if invalid
-        return enforce_license()
+    # Not validated yet, or invalid: enforce_license() verifies or raises
+    return enforce_license()
 
-    if not _cached_license.valid:
-        raise LicenseValidationError(f"Invalid license: {_cached_license.reason}")
 
+def get_cached_status() -> Optional[LicenseStatus]:
+    """
+    Return the license status cached in this process without validating,
+    or None if no license has been resolved yet. Never touches the network.
+    """
     return _cached_license
 
 
@@ -154,6 +602,36 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+def _gate(
+    func: Callable[P, R], check: Optional[Callable[[LicenseStatus], None]]
+) -> Callable[P, R]:
+    """
+    Wrap `func` so it runs only under a valid license accepted by `check`
+    (which raises PermissionError to reject). Once the gate has passed,
+    calls skip the license lookup until a new license is published.
+    """
+    token_seen = -1
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        nonlocal token_seen
+
+        # Fast path: gate already passed against the current license
+        if token_seen == _license_token:
+            return func(*args, **kwargs)
+
+        token = _license_token
+        status = get_license_status()
+
+        if check is not None and status is not _DEV_LICENSE:
+            check(status)
+
+        token_seen = token
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
 def require_license(plan: Optional[str] = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
     Decorator to require a valid license, optionally for a specific plan/tier.
@@ -166,27 +644,22 @@ def require_license(plan: Optional[str] = None) -> Callable[[Callable[P, R]], Ca
             ...
     """
 
-    def decorator(func: Callable[P, R]) -> Callable[P, R]:
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            status = get_license_status()
-
-            if plan is not None:
-                if status.plan is None:
-                    raise PermissionError(
-                        f"This feature requires plan '{plan}', but your license has no plan assigned."
-                    )
-                if status.plan != plan:
-                    raise PermissionError(
-                        f"This feature requires plan '{plan}', but your license plan is '{status.plan}'."
-                    )
+    check: Optional[Callable[[LicenseStatus], None]] = None
+    if plan is not None:
+        requirement = f"This feature requires plan '{plan}'"
 
-            return func(*args, **kwargs)
+        def check(status: LicenseStatus) -> None:
+            if status.plan is None:
+                raise PermissionError(
+                    f"{requirement}, but your license has no plan assigned."
+                )
+            if status.plan != plan:
+                raise PermissionError(
+                    f"{requirement}, but your license plan is '{status.plan}'."
+                )
 
-        # Preserve metadata (name, docstring) in a simple way
-        wrapper.__name__ = func.__name__
-        wrapper.__doc__ = func.__doc__
-        wrapper.__qualname__ = func.__qualname__
-        return wrapper
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        return _gate(func, check)
 
     return decorator
 
@@ -200,25 +673,20 @@ def require_license_any(plans: list[str]) -> Callable[[Callable[P, R]], Callable
             ...
     """
 
-    def decorator(func: Callable[P, R]) -> Callable[P, R]:
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            status = get_license_status()
+    allowed = frozenset(plans)
+    requirement = f"This feature requires one of plans {plans!r}"
 
-            if not status.plan:
-                raise PermissionError(
-                    f"This feature requires one of plans {plans}, but your license has no plan assigned."
-                )
-            if status.plan not in plans:
-                raise PermissionError(
-                    f"This feature requires one of plans {plans}, but your license plan is '{status.plan}'."
-                )
+    def check(status: LicenseStatus) -> None:
+        if not status.plan:
+            raise PermissionError(
+                f"{requirement}, but your license has no plan assigned."
+            )
+        if status.plan not in allowed:
+            raise PermissionError(
+                f"{requirement}, but your license plan is '{status.plan}'."
+            )
 
-            return func(*args, **kwargs)
-
-        wrapper.__name__ = func.__name__
-        wrapper.__doc__ = func.__doc__
-        wrapper.__qualname__ = func.__qualname__
-        return wrapper
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        return _gate(func, check)
 
     return decorator
-
@@ -0,0 +1,304 @@
+import asyncio
+import base64
+import dataclasses
+import hashlib
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from your_project import license_check
+from your_project.license_check import LicenseStatus, require_license
+
+
+def _publish(monkeypatch, status):
+    # register the module state with monkeypatch so it is restored afterwards
+    monkeypatch.setattr(license_check, "_cached_license", None)
+    monkeypatch.setattr(license_check, "_license_token", license_check._license_token)
+    license_check._publish_license(status)
+
+
+def test_require_license_rechecks_after_license_changes(monkeypatch):
+    @require_license("pro")
+    def feature():
+        return "ok"
+
+    _publish(monkeypatch, LicenseStatus(valid=True, reason="OK", plan="pro"))
+    assert feature() == "ok"
+    assert feature() == "ok"
+
+    _publish(monkeypatch, LicenseStatus(valid=True, reason="OK", plan="basic"))
+    with pytest.raises(PermissionError):
+        feature()
+
+
+@pytest.fixture
+def fresh_license_state(monkeypatch):
+    """Call with a license key to start from an unverified process state."""
+
+    def reset(key):
+        monkeypatch.setattr(license_check, "_get_license_key_from_env", lambda: key)
+        # register the module state with monkeypatch so it is restored afterwards
+        monkeypatch.setattr(license_check, "_cached_license", None)
+        monkeypatch.setattr(
+            license_check, "_license_token", license_check._license_token
+        )
+
+    return reset
+
+
+def _signed_token(private_key, key, status, iat, exp):
+    payload = {
+        "key_sha256": hashlib.sha256(key.encode()).hexdigest(),
+        "status": status,
+        "iat": iat,
+        "exp": exp,
+    }
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+
+    def b64(data):
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+    return b64(body) + "." + b64(private_key.sign(body))
+
+
+@pytest.fixture
+def config(monkeypatch, tmp_path):
+    """License checks enabled, with the disk caches under tmp_path."""
+    config = dataclasses.replace(
+        license_check._CONFIG,
+        disabled=False,
+        cache_path=tmp_path / "license.json",
+        negative_cache_path=tmp_path / "negative.json",
+    )
+    monkeypatch.setattr(license_check, "_CONFIG", config)
+    return config
+
+
+@pytest.fixture
+def signing_key(monkeypatch, config):
+    ed25519 = pytest.importorskip(
+        "cryptography.hazmat.primitives.asymmetric.ed25519"
+    )
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    monkeypatch.setattr(
+        license_check, "_load_public_key", lambda: private_key.public_key()
+    )
+    return private_key
+
+
+def test_license_cache_round_trip_is_bound_to_key(signing_key):
+    status = {"valid": True, "reason": "OK", "plan": "pro"}
+    now = time.time()
+    token = _signed_token(signing_key, "KEY-A", status, now, now + 3600)
+
+    license_check._write_license_cache(token)
+
+    cached = license_check._read_license_cache("KEY-A")
+    assert cached is not None
+    assert cached[0] == LicenseStatus(valid=True, reason="OK", plan="pro")
+    assert license_check._read_license_cache("KEY-B") is None
+
+
+def test_license_cache_rejects_tokens_not_signed_by_server(signing_key):
+    ed25519 = pytest.importorskip(
+        "cryptography.hazmat.primitives.asymmetric.ed25519"
+    )
+    forger = ed25519.Ed25519PrivateKey.generate()
+    status = {"valid": True, "reason": "OK", "plan": "enterprise"}
+    now = time.time()
+
+    license_check._write_license_cache(
+        _signed_token(forger, "KEY-A", status, now, now + 3600)
+    )
+
+    assert license_check._read_license_cache("KEY-A") is None
+
+
+def test_license_cache_expiry_is_capped_at_cache_ttl(signing_key):
+    status = {"valid": True, "reason": "OK", "plan": "pro"}
+    iat = time.time() - license_check._CONFIG.cache_ttl - 1
+    token = _signed_token(signing_key, "KEY-A", status, iat, iat + 30 * 365 * 86400)
+
+    license_check._write_license_cache(token)
+
+    assert license_check._read_license_cache("KEY-A") is None
+
+
+def test_dev_license_passes_plan_gates(monkeypatch):
+    @require_license("enterprise")
+    def feature():
+        return "ok"
+
+    _publish(monkeypatch, license_check._DEV_LICENSE)
+    assert feature() == "ok"
+
+
+def test_license_check_is_a_single_module():
+    module = sys.modules["your_project.license_check"]
+    assert module is license_check
+    assert id(LicenseStatus) == id(module.LicenseStatus)
+    assert set(license_check.__all__) <= set(dir(module))
+
+
+def test_negative_cache_remembers_rejected_key(config):
+    rejected = LicenseStatus(valid=False, reason="License not found")
+
+    license_check._store_result("BAD-KEY", rejected, None)
+
+    assert license_check._load_cached_license("BAD-KEY") == rejected
+    assert license_check._load_cached_license("OTHER-KEY") is None
+    assert "BAD-KEY" not in config.negative_cache_path.read_text()
+
+
+def test_get_license_status_rejects_cached_invalid_license(monkeypatch):
+    invalid = LicenseStatus(valid=False, reason="License expired")
+    _publish(monkeypatch, invalid)
+
+    assert license_check.get_cached_status() is invalid
+    with pytest.raises(license_check.LicenseValidationError):
+        license_check.get_license_status()
+
+
+def test_background_refresh_result_is_not_overwritten(
+    signing_key, fresh_license_state, monkeypatch
+):
+    ttl = license_check._CONFIG.cache_ttl
+    iat = time.time() - ttl * 0.95  # inside the refresh window
+    status = {"valid": True, "reason": "OK", "plan": "pro"}
+    license_check._write_license_cache(
+        _signed_token(signing_key, "KEY-A", status, iat, iat + ttl)
+    )
+    revoked = LicenseStatus(valid=False, reason="License status is revoked")
+    monkeypatch.setattr(
+        license_check, "_verify_license_online", lambda key: (revoked, None)
+    )
+    fresh_license_state("KEY-A")
+
+    # Give the refresh thread a head start over the startup publish
+    started = []
+
+    class HeadStartThread(threading.Thread):
+        def start(self):
+            super().start()
+            started.append(self)
+            self.join(timeout=0.2)
+
+    monkeypatch.setattr(license_check.threading, "Thread", HeadStartThread)
+
+    license_check.enforce_license()
+    for thread in started:
+        thread.join(timeout=5)
+
+    assert license_check.get_cached_status() == revoked
+
+
+def test_async_client_is_recreated_for_each_event_loop(monkeypatch):
+    pytest.importorskip("httpx")
+    monkeypatch.setattr(license_check, "_async_client", None)
+    monkeypatch.setattr(license_check, "_async_client_loop", None)
+
+    async def get_client():
+        client = license_check._get_async_client()
+        assert license_check._get_async_client() is client
+        return client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+    assert first is not second
+    asyncio.run(license_check.aclose_license_client())
+
+
+def test_enforce_license_async_publishes_server_result(
+    config, fresh_license_state, monkeypatch
+):
+    status = LicenseStatus(valid=True, reason="OK", plan="pro")
+
+    async def verify(key):
+        return status, None
+
+    monkeypatch.setattr(license_check, "_verify_license_online_async", verify)
+    fresh_license_state("KEY-A")
+
+    assert asyncio.run(license_check.enforce_license_async()) is status
+    assert license_check.get_cached_status() is status
+
+
+def test_enforce_license_async_raises_for_rejected_key(
+    config, fresh_license_state, monkeypatch
+):
+    async def verify(key):
+        return LicenseStatus(valid=False, reason="License not found"), None
+
+    monkeypatch.setattr(license_check, "_verify_license_online_async", verify)
+    fresh_license_state("BAD-KEY")
+
+    with pytest.raises(license_check.LicenseValidationError):
+        asyncio.run(license_check.enforce_license_async())
+
+
+def test_malformed_ttl_falls_back_to_default(monkeypatch):
+    monkeypatch.setenv("LICENSE_CACHE_TTL", "1h")
+    monkeypatch.setenv("LICENSE_NEGATIVE_CACHE_TTL", "")
+
+    with pytest.warns(UserWarning, match="Ignoring invalid"):
+        config = license_check._load_config()
+
+    assert config.cache_ttl == 24 * 60 * 60
+    assert config.negative_cache_ttl == 60
+
+
+def test_first_retry_is_jittered():
+    retry = license_check._make_retry().increment(method="GET", url="/verify")
+
+    backoffs = {retry.get_backoff_time() for _ in range(20)}
+
+    assert all(0 <= backoff <= license_check._RETRY_JITTER for backoff in backoffs)
+    assert len(backoffs) > 1
+
+
+def test_rejection_only_drops_cache_of_same_key(signing_key):
+    status = {"valid": True, "reason": "OK", "plan": "pro"}
+    now = time.time()
+    license_check._write_license_cache(
+        _signed_token(signing_key, "KEY-A", status, now, now + 3600)
+    )
+    rejected = LicenseStatus(valid=False, reason="License not found")
+
+    license_check._store_result("TYPO-KEY", rejected, None)
+    assert license_check._read_license_cache("KEY-A") is not None
+
+    license_check._store_result("KEY-A", rejected, None)
+    assert license_check._read_license_cache("KEY-A") is None
+
+
+def test_concurrent_first_calls_verify_once(config, fresh_license_state, monkeypatch):
+    fresh_license_state("KEY-A")
+    token_before = license_check._license_token
+    status = LicenseStatus(valid=True, reason="OK", plan="pro")
+    calls = []
+
+    def slow_verify(key):
+        calls.append(key)
+        time.sleep(0.05)
+        return status, None
+
+    monkeypatch.setattr(license_check, "_verify_license_online", slow_verify)
+    barrier = threading.Barrier(20)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(license_check.enforce_license())
+
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls == ["KEY-A"]
+    assert license_check._license_token == token_before + 1
+    assert results == [status] * 20
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+"""
+Generate the Ed25519 key pair used to sign license verification tokens.
+
+- The private key goes into the license server's LICENSE_SIGNING_KEY env var.
+- The public key is pasted into _LICENSE_PUBLIC_KEY in license_check.py.
+"""
+import base64
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+
+
+if __name__ == "__main__":
+    private_key = Ed25519PrivateKey.generate()
+    private_raw = private_key.private_bytes(
+        Encoding.Raw, PrivateFormat.Raw, NoEncryption()
+    )
+    public_raw = private_key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+
+    print("✅ Signing key pair generated:")
+    print(f"  LICENSE_SIGNING_KEY (server, keep secret): {base64.b64encode(private_raw).decode()}")
+    print(f"  _LICENSE_PUBLIC_KEY (client):              {base64.b64encode(public_raw).decode()}")